@@ -7,6 +7,7 @@ https://github.com/bmcclure/ha-chore-helper
 from __future__ import annotations
 
 from datetime import timedelta
+from typing import TYPE_CHECKING
 
 import homeassistant.helpers.config_validation as cv
 import homeassistant.util.dt as dt_util
@@ -20,25 +21,27 @@ import voluptuous as vol
 from . import constants, helpers
 from .constants import LOGGER
 
+if TYPE_CHECKING:
+    from .task import Task
+
 PLATFORMS: list[str] = [constants.SENSOR_PLATFORM]
 
 MIN_TIME_BETWEEN_UPDATES = timedelta(seconds=30)
 
-frequencies = [f["value"] for f in constants.FREQUENCY_OPTIONS]
-types = [f["value"] for f in constants.TYPE_OPTIONS]
-schedules = [f["value"] for f in constants.SCHEDULE_OPTIONS]
-days = [f["value"] for f in constants.DAY_OPTIONS]
+# Task entities indexed by entity_id, also exposed as
+# hass.data[DOMAIN][SENSOR_PLATFORM].
+TASKS: dict[str, Task] = {}
 
 SENSOR_SCHEMA = vol.Schema(
     {
         vol.Required(constants.CONF_ICON): cv.icon,
-        vol.Required(constants.CONF_FREQUENCY): vol.In(frequencies),
+        vol.Required(constants.CONF_FREQUENCY): vol.In(constants.FREQUENCY_VALUES),
         vol.Required(constants.CONF_PERIOD): vol.All(
             vol.Coerce(int), vol.Range(min=1, max=1000)
         ),
-        vol.Required(constants.CONF_TYPE): vol.In(types),
-        vol.Required(constants.CONF_SCHEDULE): vol.In(schedules),
-        vol.Required(constants.CONF_SCHEDULE_DAY): vol.In(days),
+        vol.Required(constants.CONF_TYPE): vol.In(constants.TYPE_VALUES),
+        vol.Required(constants.CONF_SCHEDULE): vol.In(constants.SCHEDULE_VALUES),
+        vol.Required(constants.CONF_SCHEDULE_DAY): vol.In(constants.DAY_VALUES),
         vol.Required(constants.CONF_OFFSET): vol.All(
             vol.Coerce(int), vol.Range(min=-30, max=30)
         ),
@@ -55,17 +58,16 @@ CONFIG_SCHEMA = vol.Schema(
     extra=vol.ALLOW_EXTRA,
 )
 
-COMPLETE_NOW_SCHEMA = vol.Schema(
+# Both services take only an entity_id; voluptuous compiles the schema once
+# on construction, so share a single instance between them.
+ENTITY_SERVICE_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_ENTITY_ID): cv.string,
     }
 )
 
-UPDATE_STATE_SCHEMA = vol.Schema(
-    {
-        vol.Required(CONF_ENTITY_ID): cv.string,
-    }
-)
+COMPLETE_NOW_SCHEMA = ENTITY_SERVICE_SCHEMA
+UPDATE_STATE_SCHEMA = ENTITY_SERVICE_SCHEMA
 
 
 # pylint: disable=unused-argument
@@ -76,27 +78,27 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
         """Handle the update_state service call."""
         entity_id = call.data.get(CONF_ENTITY_ID, "")
         LOGGER.debug("called update_state for %s", entity_id)
-        try:
-            entity = hass.data[constants.DOMAIN][constants.SENSOR_PLATFORM][entity_id]
-            entity.update_state()
-        except KeyError as err:
-            LOGGER.error("Failed updating state for %s - %s", entity_id, err)
+        entity = TASKS.get(entity_id)
+        if entity is None:
+            LOGGER.error("Failed updating state for %s - unknown entity", entity_id)
+            return
+        entity.update_state()
 
     async def handle_complete_task(call: ServiceCall) -> None:
         """Handle the complete_chore service call."""
         entity_id = call.data.get(CONF_ENTITY_ID, "")
         LOGGER.debug("called complete for %s", entity_id)
-        try:
-            entity = hass.data[constants.DOMAIN][constants.SENSOR_PLATFORM][entity_id]
-            entity.complete_task()
-            entity.update_state()
-        except KeyError as err:
+        entity = TASKS.get(entity_id)
+        if entity is None:
             LOGGER.error(
-                "Failed setting last completed for %s - %s", entity_id, err
+                "Failed setting last completed for %s - unknown entity", entity_id
             )
+            return
+        now = helpers.now()
+        entity.complete_task(now)
+        entity.update_state(now)
 
-    hass.data.setdefault(constants.DOMAIN, {})
-    hass.data[constants.DOMAIN].setdefault(constants.SENSOR_PLATFORM, {})
+    hass.data.setdefault(constants.DOMAIN, {})[constants.SENSOR_PLATFORM] = TASKS
     hass.services.async_register(
         constants.DOMAIN,
         "update_state",
@@ -119,7 +121,7 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
         config_entry.title,
         config_entry.options[constants.CONF_FREQUENCY],
     )
-    config_entry.add_update_listener(update_listener)
+    config_entry.async_on_unload(config_entry.add_update_listener(update_listener))
 
     # Add sensor
     await hass.config_entries.async_forward_entry_setups(config_entry, PLATFORMS)
@@ -136,14 +138,12 @@ async def async_remove_entry(hass: HomeAssistant, config_entry: ConfigEntry) ->
     except ValueError:
         pass
 
-async def async_reload_entry(hass, entry):
-    """Reload the integration without restarting Home Assistant."""
-    await async_unload_entry(hass, entry)
-    return await async_setup_entry(hass, entry)
+
+async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
+    """Unload a config entry."""
+    return await hass.config_entries.async_unload_platforms(config_entry, PLATFORMS)
+
 
 async def update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Update listener - to re-create device after options update."""
-    await hass.config_entries.async_forward_entry_unload(entry, constants.SENSOR_PLATFORM)
-    hass.async_add_job(
-        hass.config_entries.async_forward_entry_setup(entry, constants.SENSOR_PLATFORM)
-    )
+    """Update listener - reload the entry to re-create the sensor after options update."""
+    hass.config_entries.async_schedule_reload(entry.entry_id)
@@ -54,65 +54,73 @@ def optional(
     return vol.Optional(key, description={"suggested_value": suggested_value})
 
 
+_ICON_SEL = selector.IconSelector()
+_TYPE_SEL = selector.SelectSelector(
+    selector.SelectSelectorConfig(options=constants.TYPE_OPTIONS)
+)
+_FREQ_SEL = selector.SelectSelector(
+    selector.SelectSelectorConfig(options=constants.FREQUENCY_OPTIONS)
+)
+_PERIOD_SEL = selector.NumberSelector(
+    selector.NumberSelectorConfig(
+        min=1,
+        max=1000,
+        mode=selector.NumberSelectorMode.BOX,
+        step=1,
+    )
+)
+_START_DATE_SEL = selector.DateTimeSelector()
+_SCHEDULE_SEL = selector.SelectSelector(
+    selector.SelectSelectorConfig(options=constants.SCHEDULE_OPTIONS)
+)
+_SCHEDULE_DAY_SEL = selector.SelectSelector(
+    selector.SelectSelectorConfig(options=constants.DAY_OPTIONS)
+)
+_OFFSET_SEL = selector.NumberSelector(
+    selector.NumberSelectorConfig(
+        min=-30,
+        max=30,
+        mode=selector.NumberSelectorMode.BOX,
+        step=1,
+    )
+)
+_NAME_SEL = selector.TextSelector()
+
+# (marker, key, default, selector) - selectors are static, only the
+# suggested values depend on the handler options.
+_GENERAL_OPTIONS_SCHEMA_STATIC_KEYS = (
+    (required, constants.CONF_ICON, constants.DEFAULT_ICON, _ICON_SEL),
+    (required, constants.CONF_TYPE, constants.DEFAULT_TYPE, _TYPE_SEL),
+    (required, constants.CONF_FREQUENCY, constants.DEFAULT_FREQUENCY, _FREQ_SEL),
+    (required, constants.CONF_PERIOD, constants.DEFAULT_PERIOD, _PERIOD_SEL),
+    (required, constants.CONF_START_DATE, None, _START_DATE_SEL),
+    (optional, constants.CONF_SCHEDULE, constants.DEFAULT_SCHEDULE, _SCHEDULE_SEL),
+    (
+        optional,
+        constants.CONF_SCHEDULE_DAY,
+        constants.DEFAULT_SCHEDULE_DAY,
+        _SCHEDULE_DAY_SEL,
+    ),
+    (required, constants.CONF_OFFSET, constants.DEFAULT_OFFSET, _OFFSET_SEL),
+)
+
+
 def general_schema_definition(
     handler: SchemaConfigFlowHandler | SchemaOptionsFlowHandler,
 ) -> Mapping[str, Any]:
     """Create general schema."""
-    schema = {
-        required(
-            constants.CONF_ICON, handler.options, constants.DEFAULT_ICON
-        ): selector.IconSelector(),
-        required(constants.CONF_TYPE, handler.options, constants.DEFAULT_TYPE): selector.SelectSelector(
-            selector.SelectSelectorConfig(options=constants.TYPE_OPTIONS)
-        ),
-        required(
-            constants.CONF_FREQUENCY, handler.options, constants.DEFAULT_FREQUENCY
-        ): selector.SelectSelector(
-            selector.SelectSelectorConfig(options=constants.FREQUENCY_OPTIONS)
-        ),
-        required(
-            constants.CONF_PERIOD, handler.options, constants.DEFAULT_PERIOD
-        ): selector.NumberSelector(
-            selector.NumberSelectorConfig(
-                min=1,
-                max=1000,
-                mode=selector.NumberSelectorMode.BOX,
-                step=1,
-            )
-        ),
-        required(
-            constants.CONF_START_DATE, handler.options, None
-        ): selector.DateTimeSelector(),
-        optional(
-            constants.CONF_SCHEDULE, handler.options, constants.DEFAULT_SCHEDULE
-        ): selector.SelectSelector(
-            selector.SelectSelectorConfig(options=constants.SCHEDULE_OPTIONS)
-        ),
-        optional(
-            constants.CONF_SCHEDULE_DAY, handler.options, constants.DEFAULT_SCHEDULE_DAY
-        ): selector.SelectSelector(
-            selector.SelectSelectorConfig(options=constants.DAY_OPTIONS)
-        ),
-        required(
-            constants.CONF_OFFSET, handler.options, constants.DEFAULT_OFFSET
-        ): selector.NumberSelector(
-            selector.NumberSelectorConfig(
-                min=-30,
-                max=30,
-                mode=selector.NumberSelectorMode.BOX,
-                step=1,
-            )
-        ),
+    options = handler.options
+    return {
+        marker(key, options, default): sel
+        for marker, key, default, sel in _GENERAL_OPTIONS_SCHEMA_STATIC_KEYS
     }
 
-    return schema
-
 
 async def general_config_schema(
     handler: SchemaConfigFlowHandler | SchemaOptionsFlowHandler,
 ) -> vol.Schema:
     """Generate config schema."""
-    schema_obj = {required(CONF_NAME, handler.options): selector.TextSelector()}
+    schema_obj = {required(CONF_NAME, handler.options): _NAME_SEL}
     schema_obj.update(general_schema_definition(handler))
     return vol.Schema(schema_obj)
 
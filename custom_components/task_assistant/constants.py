@@ -93,3 +93,9 @@ SCHEDULE_OPTIONS = [
     selector.SelectOptionDict(value="-3", label="3rd from last"),
     selector.SelectOptionDict(value="-4", label="4th from last"),
 ]
+
+# Value sets for O(1) membership checks in config validation
+TYPE_VALUES = frozenset(option["value"] for option in TYPE_OPTIONS)
+FREQUENCY_VALUES = frozenset(option["value"] for option in FREQUENCY_OPTIONS)
+DAY_VALUES = frozenset(option["value"] for option in DAY_OPTIONS)
+SCHEDULE_VALUES = frozenset(option["value"] for option in SCHEDULE_OPTIONS)
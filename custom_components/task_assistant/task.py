@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
-from datetime import date, datetime, timedelta
+import logging
+from calendar import monthrange
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
 from typing import Any
-from dateutil.relativedelta import relativedelta
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
     ATTR_DEVICE_CLASS,
@@ -13,17 +15,88 @@ from homeassistant.const import (
 )
 from homeassistant.helpers.restore_state import RestoreEntity
 
-from . import constants, helpers
+from . import TASKS, constants, helpers
 from .constants import LOGGER
 
 
+def _naive(text: str) -> datetime:
+    """Parse an ISO datetime string and drop the timezone."""
+    return datetime.fromisoformat(text).replace(tzinfo=None)
+
+
+def _add_months(dt: datetime, months: int) -> datetime:
+    """Add calendar months, clamping the day to the end of the target month."""
+    month = dt.month - 1 + months
+    year = dt.year + month // 12
+    month = month % 12 + 1
+    day = min(dt.day, monthrange(year, month)[1])
+    return dt.replace(year=year, month=month, day=day)
+
+
+_OFFSET_FUNCS = {
+    "hours": lambda d, p: d + timedelta(hours=p),
+    "days": lambda d, p: d + timedelta(days=p),
+    "weeks": lambda d, p: d + timedelta(weeks=p),
+    "months": _add_months,
+    "years": lambda d, p: _add_months(d, p * 12),
+}
+
+_PERIOD_UNITS = {
+    "hours": timedelta(hours=1),
+    "days": timedelta(days=1),
+    "weeks": timedelta(weeks=1),
+}
+_PERIOD_MONTHS = {"months": 1, "years": 12}
+
+
+def _periods_between(start: datetime, end: datetime, frequency: str, period: int) -> int:
+    """Return the number of whole periods between start and end, rounded down."""
+    if (unit := _PERIOD_UNITS.get(frequency)) is not None:
+        return (end - start) // (unit * period)
+    step = _PERIOD_MONTHS[frequency] * period
+    return ((end.year - start.year) * 12 + end.month - start.month) // step
+
+
+@lru_cache(maxsize=4096)
+def _nth_weekday(year: int, month: int, weekday: int, nth: int) -> date | None:
+    """Return the nth occurrence of a weekday in a month, None if it does not exist.
+
+    A negative nth counts back from the end of the month, -1 being the last one.
+    """
+    if nth < 0:
+        # Start from the last day of the month
+        last_day = date(year, month, monthrange(year, month)[1])
+        days_back = (last_day.weekday() - weekday + 7) % 7
+        last_occurrence = last_day - timedelta(days=days_back)
+        # Every weekday occurs at least four times, so -1 to -4 always exist
+        nth_occurrence = last_occurrence + timedelta(weeks=nth + 1)
+        if nth_occurrence.month != month:
+            return None
+        return nth_occurrence
+    # Start from the first day of the month
+    first_day = date(year, month, 1)
+    # Calculate the first occurrence of the target weekday
+    days_to_weekday = (weekday - first_day.weekday() + 7) % 7
+    first_occurrence = first_day + timedelta(days=days_to_weekday)
+    # Calculate the nth occurrence
+    nth_occurrence = first_occurrence + timedelta(weeks=nth - 1)
+
+    # Check if the nth occurrence is still in the same month
+    if nth_occurrence.month != month:
+        return None  # That nth weekday does not exist in this month
+    return nth_occurrence
+
+
 class Task(RestoreEntity):
     """Task Sensor class."""
 
+    DEVICE_CLASS = constants.DEVICE_CLASS
+
     __slots__ = (
         "_attr_icon",
         "_attr_name",
         "_attr_state",
+        "_days",
         "_due_date",
         "_last_updated",
         "_last_completed",
@@ -31,59 +104,89 @@ class Task(RestoreEntity):
         "_overdue_days",
         "_frequency",
         "_period",
+        "_add_period",
         "_type",
+        "_schedule",
+        "_schedule_day",
+        "_offset",
         "_start_date",
+        "_task_time",
+        "_attrs_cache",
+        "_due_cache_key",
+        "_loaded_fired",
+        "_unit",
+        "_fired_due_date",
+        "_next_refresh",
         "config_entry",
     )
 
     def __init__(self, config_entry: ConfigEntry) -> None:
         """Read configuration and initialise class variables."""
         self._days: int | None = None
+        self._unit: str = "days"
         self._due_date: datetime | None = None
-        config = config_entry.options
+        self._attrs_cache: dict[str, Any] | None = None
+        self._due_cache_key: tuple | None = None
+        self._loaded_fired: bool = False
+        self._fired_due_date: datetime | None = None
+        self._next_refresh: datetime | None = None
+        get = config_entry.options.get
         self.config_entry = config_entry
         self._attr_name = (
             config_entry.title
             if config_entry.title is not None
-            else config.get(CONF_NAME)
+            else get(CONF_NAME)
         )
-        self._attr_icon = config.get(constants.CONF_ICON)
+        self._attr_icon = get(constants.CONF_ICON)
         self._last_updated: datetime | None = None
         self._overdue: bool = False
         self._overdue_days: int | None = None
-        self._frequency: str = config.get(constants.CONF_FREQUENCY)
-        self._period: int = config.get(constants.CONF_PERIOD)
-        self._type: str = config.get(constants.CONF_TYPE)
-        self._schedule: int | None = int(config.get(constants.CONF_SCHEDULE))
-        self._schedule_day: int | None = int(config.get(constants.CONF_SCHEDULE_DAY))
-        self._offset: int | None = int(config.get(constants.CONF_OFFSET))
+        self._frequency: str = get(constants.CONF_FREQUENCY)
+        try:
+            self._add_period = _OFFSET_FUNCS[self._frequency]
+        except KeyError:
+            raise ValueError("Invalid unit. Use 'hours', 'days', 'weeks', 'months' or 'years'.") from None
+        # Number selectors store floats, the month arithmetic needs an int
+        self._period: int = int(get(constants.CONF_PERIOD))
+        self._type: str = get(constants.CONF_TYPE)
+        self._schedule: int | None = int(get(constants.CONF_SCHEDULE))
+        self._schedule_day: int | None = int(get(constants.CONF_SCHEDULE_DAY))
+        self._offset: int | None = int(get(constants.CONF_OFFSET))
         self._attr_state = self._days
-        self._start_date: datetime
-        self._start_date = datetime.fromisoformat(config.get(constants.CONF_START_DATE)).replace(tzinfo=None)
-        self._last_completed: datetime = self._start_date
+        # Without a start date the task has no due date
+        start_date = get(constants.CONF_START_DATE)
+        self._start_date: datetime | None = (
+            _naive(start_date) if start_date is not None else None
+        )
+        self._task_time: time | None = (
+            self._start_date.time() if self._start_date is not None else None
+        )
+        self._last_completed: datetime | None = self._start_date
 
     async def async_added_to_hass(self) -> None:
         """When sensor is added to HA, restore state and add it to calendar."""
         await super().async_added_to_hass()
-        self.hass.data[constants.DOMAIN][constants.SENSOR_PLATFORM][self.entity_id] = self
+        TASKS[self.entity_id] = self
 
         # Restore stored state
         if (state := await self.async_get_last_state()) is not None:
             self._last_updated = None  # Unblock update - after options change
             self._attr_state = state.state
-            if state.attributes.get(constants.ATTR_DUE_DATE, None) is not None:
-                self._due_date = datetime.fromisoformat(state.attributes.get(constants.ATTR_DUE_DATE, None)).replace(tzinfo=None)
-            if state.attributes.get(constants.ATTR_LAST_COMPLETED, None) is not None:
-                self._start_date = datetime.fromisoformat(state.attributes.get(constants.ATTR_LAST_COMPLETED, None)).replace(tzinfo=None)
-            if state.attributes.get(constants.ATTR_START_DATE, None) is not None:
-                self._due_date = datetime.fromisoformat(state.attributes.get(constants.ATTR_START_DATE, None)).replace(tzinfo=None)
-            self._overdue = state.attributes.get(constants.ATTR_OVERDUE, False)
-            self._overdue_days = state.attributes.get(constants.ATTR_OVERDUE_DAYS, None)
+            get = state.attributes.get
+            if (due_date := get(constants.ATTR_DUE_DATE)) is not None:
+                self._due_date = _naive(due_date)
+            if (last_completed := get(constants.ATTR_LAST_COMPLETED)) is not None:
+                self._last_completed = _naive(last_completed)
+            self._overdue = get(constants.ATTR_OVERDUE, False)
+            self._overdue_days = get(constants.ATTR_OVERDUE_DAYS)
+            self._attrs_cache = None
+            self._next_refresh = None
+            self._due_cache_key = None
 
     async def async_will_remove_from_hass(self) -> None:
         """When sensor is removed from HA, remove it and its calendar entity."""
         await super().async_will_remove_from_hass()
-        del self.hass.data[constants.DOMAIN][constants.SENSOR_PLATFORM][self.entity_id]
+        TASKS.pop(self.entity_id, None)
 
     @property
     def unique_id(self) -> str:
@@ -120,7 +223,7 @@ class Task(RestoreEntity):
     @property
     def native_unit_of_measurement(self) -> str | None:
         """Return unit of measurement - None for numerical value."""
-        return "day" if self._days == 1 else "days"
+        return self._unit
 
     @property
     def native_value(self) -> object:
@@ -145,23 +248,24 @@ class Task(RestoreEntity):
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return the state attributes."""
+        if self._attrs_cache is None:
+            self._attrs_cache = self._build_state_attributes()
+        return self._attrs_cache
+
+    def _build_state_attributes(self) -> dict[str, Any]:
+        """Build the state attributes, cached until the state changes."""
         return {
-            constants.ATTR_LAST_COMPLETED: self.last_completed,
-            constants.ATTR_LAST_UPDATED: self.last_updated,
-            constants.ATTR_OVERDUE: self.overdue,
-            constants.ATTR_OVERDUE_DAYS: self.overdue_days,
-            constants.ATTR_DUE_DATE: self.due_date,
-            constants.ATTR_START_DATE: self.start_date,
-            ATTR_UNIT_OF_MEASUREMENT: self.native_unit_of_measurement,
+            constants.ATTR_LAST_COMPLETED: self._last_completed,
+            constants.ATTR_LAST_UPDATED: self._last_updated,
+            constants.ATTR_OVERDUE: self._overdue,
+            constants.ATTR_OVERDUE_DAYS: self._overdue_days,
+            constants.ATTR_DUE_DATE: self._due_date,
+            constants.ATTR_START_DATE: self._start_date,
+            ATTR_UNIT_OF_MEASUREMENT: self._unit,
             # Needed for translations to work
             ATTR_DEVICE_CLASS: self.DEVICE_CLASS,
         }
 
-    @property
-    def DEVICE_CLASS(self) -> str:  # pylint: disable=C0103
-        """Return the class of the sensor."""
-        return constants.DEVICE_CLASS
-
     def __repr__(self) -> str:
         """Return main sensor parameters."""
         return (
@@ -175,99 +279,137 @@ class Task(RestoreEntity):
         """
         Finds the date of the nth occurrence of a weekday in a specific month and year.
         """
-        # Start from the first day of the month
-        first_day = date(year, month, 1)
-        # Calculate the first occurrence of the target weekday
-        days_to_weekday = (weekday - first_day.weekday() + 7) % 7
-        first_occurrence = first_day + timedelta(days=days_to_weekday)
-        # Calculate the nth occurrence
-        nth_occurrence = first_occurrence + timedelta(weeks=nth - 1)
-
-        # Check if the nth occurrence is still in the same month
-        if nth_occurrence.month != month:
-            return None  # That nth weekday does not exist in this month
+        nth_occurrence = _nth_weekday(year, month, weekday, nth)
+        if nth_occurrence is None:
+            return None
         return datetime.combine(nth_occurrence, time)
 
-    def get_next_due_date(self) -> datetime | None:
-        """Get next date from self._due_dates."""
-        due_date = helpers.now()
+    def get_next_due_date(self, now: datetime) -> datetime | None:
+        """Calculate the next due date from the task schedule."""
+        if self._start_date is None:
+            return None
+        due_date = now
         if self._type == "after":
-            due_date = self._add_period_offset(self._last_completed, self._frequency, self._period)
+            due_date = self._add_period(self._last_completed, self._period)
         elif self._type == "every":
-            while self._last_completed > self._start_date:
-                self._start_date = self._add_period_offset(self._start_date, self._frequency, self._period)
-            due_date = self._add_period_offset(self._start_date, self._frequency, self._period)
+            # Jump straight to the first occurrence not before the last completion
+            periods = 0
+            if self._last_completed > self._start_date:
+                periods = _periods_between(self._start_date, self._last_completed, self._frequency, self._period)
+                if self._add_period(self._start_date, periods * self._period) < self._last_completed:
+                    periods += 1
+            due_date = self._add_period(self._start_date, (periods + 1) * self._period)
         elif self._type == "scheduled":
-            task_time = self._start_date.time()
-            year = self._last_completed.year
-            month = self._last_completed.month
-            due_date = self.get_nth_weekday_of_month(task_time, year, month, self._schedule_day, self._schedule)
-            while due_date and due_date <= helpers.now():
-                # If due date has passed or doesn't exist, move to next month
-                year = year + (1 if month == 12 else 0)
-                month = 1 if month == 12 else month + 1
+            task_time = self._task_time
+            start = max(self._last_completed, now)
+            year = start.year
+            month = start.month
+            # The current month plus the next 12 always contain the nth weekday,
+            # only a 5th occurrence is missing from some months
+            for _ in range(13):
                 due_date = self.get_nth_weekday_of_month(task_time, year, month, self._schedule_day, self._schedule)
-        due_date = self._add_period_offset(due_date, "days", self._offset)
-        return due_date
-
-    def complete_task(self):
-        self._last_completed = helpers.now()
+                if due_date is not None and due_date > now:
+                    break
+                # If due date has passed or doesn't exist, move to next month
+                month += 1
+                if month > 12:
+                    month = 1
+                    year += 1
+            else:
+                return None
+        return due_date + timedelta(days=self._offset)
+
+    def complete_task(self, now: datetime | None = None):
+        self._last_completed = now if now is not None else helpers.now()
+        self._attrs_cache = None
 
     async def async_update(self) -> None:
         """Get the latest data and updates the states."""
         if not self.hass.is_running:
             return
 
-        LOGGER.debug("(%s) Calling update", self._attr_name)
-        LOGGER.debug(
-            "(%s) Dates loaded, firing a task_helper_loaded event",
-            self._attr_name,
+        # The day count only changes on rollovers, so last_updated only
+        # advances then (or on service calls)
+        now = helpers.now()
+        if self._next_refresh is None or now >= self._next_refresh:
+            if LOGGER.isEnabledFor(logging.DEBUG):
+                LOGGER.debug("(%s) Calling update", self._attr_name)
+            self.update_state(now)
+        # Checked on every scan, service calls can change the due date
+        # between rollovers. Only announce the initial load and changes.
+        if not self._loaded_fired or self._due_date != self._fired_due_date:
+            event_data = {
+                "entity_id": self.entity_id,
+            }
+            self.hass.bus.async_fire("task_helper_loaded", event_data)
+            self._loaded_fired = True
+            self._fired_due_date = self._due_date
+
+    def _due_date_inputs(self) -> tuple:
+        """Return the values the due date is derived from."""
+        return (
+            self._last_completed,
+            self._start_date,
+            self._type,
+            self._frequency,
+            self._period,
+            self._schedule,
+            self._schedule_day,
+            self._offset,
+        )
+
+    def _due_date_is_stale(self, now: datetime) -> bool:
+        """Return True if the due date has to be recalculated."""
+        if self._due_date_inputs() != self._due_cache_key:
+            return True
+        # Scheduled tasks roll over to the next month once the date passes
+        return (
+            self._type == "scheduled"
+            and self._due_date is not None
+            and self._due_date - timedelta(days=self._offset) <= now
         )
-        event_data = {
-            "entity_id": self.entity_id,
-        }
-        self.hass.bus.async_fire("task_helper_loaded", event_data)
-        self.update_state()
 
-    def update_state(self) -> None:
+    def update_state(self, now: datetime | None = None) -> None:
         """Pick the first event from task dates, update attributes."""
-        LOGGER.debug("(%s) Looking for next task date", self._attr_name)
-        self._last_updated = helpers.now()
-        self._due_date = self.get_next_due_date()
+        debug = LOGGER.isEnabledFor(logging.DEBUG)
+        if debug:
+            LOGGER.debug("(%s) Looking for next task date", self._attr_name)
+        if now is None:
+            now = helpers.now()
+        self._last_updated = now
+        if self._due_date_is_stale(now):
+            self._due_date = self.get_next_due_date(now)
+            self._due_cache_key = self._due_date_inputs()
         if self._due_date is not None:
-            LOGGER.debug(
-                "(%s) next_due_date (%s), today (%s)",
-                self._attr_name,
-                self._due_date,
-                self._last_updated,
-            )
             overdue_time = self._due_date - self._last_updated
             self._days = overdue_time.days
-            LOGGER.debug(
-                "(%s) Found next task date: %s, that is in %d days",
-                self._attr_name,
-                self._due_date,
-                self._days,
-            )
+            if debug:
+                LOGGER.debug(
+                    "(%s) next_due_date (%s), today (%s)",
+                    self._attr_name,
+                    self._due_date,
+                    self._last_updated,
+                )
+                LOGGER.debug(
+                    "(%s) Found next task date: %s, that is in %d days",
+                    self._attr_name,
+                    self._due_date,
+                    self._days,
+                )
             self._attr_state = self._days
             self._overdue = self._days < 0
-            self._overdue_days = 0 if self._days > -1 else abs(self._days)
+            self._overdue_days = -self._days if self._overdue else 0
         else:
             self._days = None
             self._attr_state = None
             self._overdue = False
             self._overdue_days = None
-
-    def _add_period_offset(self, start_date: datetime, frequency: str, period: int) -> datetime:
-        if frequency == "hours":
-            return start_date + timedelta(hours=period)
-        elif frequency == "days":
-            return start_date + timedelta(days=period)
-        elif frequency == "weeks":
-            return start_date + timedelta(weeks=period)
-        elif frequency == "months":
-            return start_date + relativedelta(months=period)
-        elif frequency == "years":
-            return start_date + relativedelta(years=period)
-        else:
-            raise ValueError("Invalid unit. Use 'hours', 'days', 'weeks', 'months' or 'years'.")
+        self._unit = "day" if self._days == 1 else "days"
+        # The day count stays the same while now < due_date - days; the
+        # boundary itself is refreshed too, as scheduled rollovers land on it
+        self._next_refresh = (
+            self._due_date - timedelta(days=self._days)
+            if self._due_date is not None
+            else None
+        )
+        self._attrs_cache = self._build_state_attributes()